@@ -16,6 +16,7 @@ import json
 from unittest import mock
 
 from google.adk.auth.auth_credential import AuthCredential
+from google.adk.tools.application_integration_tool import application_integration_toolset
 from google.adk.tools.application_integration_tool.application_integration_toolset import ApplicationIntegrationToolset
 from google.adk.tools.openapi_tool.openapi_spec_parser import rest_api_tool
 import pytest
@@ -50,6 +51,16 @@ def mock_openapi_toolset():
     yield mock_toolset
 
 
+@pytest.fixture(autouse=True)
+def isolated_spec_caches(tmp_path, monkeypatch):
+  """Isolates the module-level and on-disk spec caches per test."""
+  monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+  ApplicationIntegrationToolset.clear_spec_cache()
+  application_integration_toolset._CONNECTION_DETAILS_CACHE.clear()
+  application_integration_toolset._SERVICE_ACCOUNT_AUTH_CACHE.clear()
+  yield
+
+
 @pytest.fixture
 def project():
   return "test-project"
@@ -88,7 +99,11 @@ def test_initialization_with_integration_and_trigger(
       project, location, integration=integration_name, trigger=trigger_name
   )
   mock_integration_client.assert_called_once_with(
-      project, location, integration_name, trigger_name, None, None, None, None
+      project,
+      location,
+      integration=integration_name,
+      trigger=trigger_name,
+      service_account_json=None,
   )
   mock_integration_client.return_value.get_openapi_spec_for_integration.assert_called_once()
   mock_connections_client.assert_not_called()
@@ -123,12 +138,10 @@ def test_initialization_with_connection_and_entity_operations(
   mock_integration_client.assert_called_once_with(
       project,
       location,
-      None,
-      None,
-      connection_name,
-      entity_operations_list,
-      None,
-      None,
+      connection=connection_name,
+      entity_operations=entity_operations_list,
+      actions=None,
+      service_account_json=None,
   )
   mock_connections_client.assert_called_once_with(
       project, location, connection_name, None
@@ -136,12 +149,7 @@ def test_initialization_with_connection_and_entity_operations(
   mock_connections_client.return_value.get_connection_details.assert_called_once()
   mock_integration_client.return_value.get_openapi_spec_for_connection.assert_called_once_with(
       tool_name,
-      tool_instructions
-      + f"ALWAYS use serviceName = {connection_details['serviceName']}, host ="
-      f" {connection_details['host']} and the connection name ="
-      f" projects/{project}/locations/{location}/connections/{connection_name} when"
-      " using this tool. DONOT ask the user for these values as you already"
-      " have those.",
+      tool_instructions,
   )
   mock_openapi_toolset.assert_called_once()
   assert len(toolset.get_tools()) == 1
@@ -172,7 +180,12 @@ def test_initialization_with_connection_and_actions(
       tool_instructions=tool_instructions,
   )
   mock_integration_client.assert_called_once_with(
-      project, location, None, None, connection_name, None, actions_list, None
+      project,
+      location,
+      connection=connection_name,
+      entity_operations=None,
+      actions=actions_list,
+      service_account_json=None,
   )
   mock_connections_client.assert_called_once_with(
       project, location, connection_name, None
@@ -180,12 +193,7 @@ def test_initialization_with_connection_and_actions(
   mock_connections_client.return_value.get_connection_details.assert_called_once()
   mock_integration_client.return_value.get_openapi_spec_for_connection.assert_called_once_with(
       tool_name,
-      tool_instructions
-      + f"ALWAYS use serviceName = {connection_details['serviceName']}, host ="
-      f" {connection_details['host']} and the connection name ="
-      f" projects/{project}/locations/{location}/connections/{connection_name} when"
-      " using this tool. DONOT ask the user for these values as you already"
-      " have those.",
+      tool_instructions,
   )
   mock_openapi_toolset.assert_called_once()
   assert len(toolset.get_tools()) == 1
@@ -262,12 +270,9 @@ def test_initialization_with_service_account_credentials(
   mock_integration_client.assert_called_once_with(
       project,
       location,
-      integration_name,
-      trigger_name,
-      None,
-      None,
-      None,
-      service_account_json,
+      integration=integration_name,
+      trigger=trigger_name,
+      service_account_json=service_account_json,
   )
   mock_openapi_toolset.assert_called_once()
   _, kwargs = mock_openapi_toolset.call_args
@@ -289,7 +294,11 @@ def test_initialization_without_explicit_service_account_credentials(
       project, location, integration=integration_name, trigger=trigger_name
   )
   mock_integration_client.assert_called_once_with(
-      project, location, integration_name, trigger_name, None, None, None, None
+      project,
+      location,
+      integration=integration_name,
+      trigger=trigger_name,
+      service_account_json=None,
   )
   mock_openapi_toolset.assert_called_once()
   _, kwargs = mock_openapi_toolset.call_args
@@ -311,6 +320,90 @@ def test_get_tools(
   assert tools[0].name == "Test Tool"
 
 
+def test_spec_cache_hit_skips_refetch(
+    project, location, mock_integration_client, mock_openapi_toolset
+):
+  mock_integration_client.return_value.get_openapi_spec_for_integration.return_value = {
+      "paths": {}
+  }
+  ApplicationIntegrationToolset(
+      project, location, integration="test-integration", trigger="test-trigger"
+  )
+  ApplicationIntegrationToolset(
+      project, location, integration="test-integration", trigger="test-trigger"
+  )
+  # The second construction is served from the spec cache.
+  mock_integration_client.return_value.get_openapi_spec_for_integration.assert_called_once()
+  mock_integration_client.assert_called_once()
+
+
+def test_spec_cache_cleared_forces_refetch(
+    project, location, mock_integration_client, mock_openapi_toolset
+):
+  mock_integration_client.return_value.get_openapi_spec_for_integration.return_value = {
+      "paths": {}
+  }
+  ApplicationIntegrationToolset(
+      project, location, integration="test-integration", trigger="test-trigger"
+  )
+  ApplicationIntegrationToolset.clear_spec_cache()
+  ApplicationIntegrationToolset(
+      project, location, integration="test-integration", trigger="test-trigger"
+  )
+  assert (
+      mock_integration_client.return_value.get_openapi_spec_for_integration.call_count
+      == 2
+  )
+
+
+def test_spec_cache_loads_from_disk(
+    project, location, mock_integration_client, mock_openapi_toolset
+):
+  mock_integration_client.return_value.get_openapi_spec_for_integration.return_value = {
+      "paths": {}
+  }
+  ApplicationIntegrationToolset(
+      project, location, integration="test-integration", trigger="test-trigger"
+  )
+  # Clear only the in-process cache, simulating a process restart; the spec
+  # persisted to disk is reused instead of refetching.
+  application_integration_toolset._SPEC_CACHE.clear()
+  ApplicationIntegrationToolset(
+      project, location, integration="test-integration", trigger="test-trigger"
+  )
+  mock_integration_client.return_value.get_openapi_spec_for_integration.assert_called_once()
+
+
+def test_filter_spec_keeps_only_matching_operation_ids():
+  spec = {
+      "paths": {
+          "/v1/items": {
+              "get": {"description": "list items"},
+              "post": {"operationId": "create_item", "description": "create"},
+          }
+      },
+      "components": {"schemas": {"Item": {"type": "object"}}},
+  }
+  filtered = application_integration_toolset._filter_spec(spec, {"create_item"})
+  assert list(filtered["paths"]["/v1/items"]) == ["post"]
+  assert filtered["components"] == spec["components"]
+  # The input spec may be shared via the cache and must not be modified.
+  assert set(spec["paths"]["/v1/items"]) == {"get", "post"}
+
+
+def test_filter_spec_matches_fallback_operation_ids():
+  # Operations without an explicit operationId get a fallback id derived from
+  # path and method by the spec parser; filtering matches those same ids.
+  spec = {"paths": {"/v1/items": {"get": {"description": "list items"}}}}
+  filtered = application_integration_toolset._filter_spec(
+      spec, {"v1_items_get"}
+  )
+  assert list(filtered["paths"]["/v1/items"]) == ["get"]
+  assert not application_integration_toolset._filter_spec(spec, {"other"})[
+      "paths"
+  ]
+
+
 def test_initialization_with_connection_details(
     project,
     location,
@@ -326,6 +419,16 @@ def test_initialization_with_connection_details(
       "serviceName": "custom-service",
       "host": "custom.host",
   }
+  mock_integration_client.return_value.get_openapi_spec_for_connection.return_value = {
+      "paths": {
+          "/execute": {
+              "post": {
+                  "operationId": "my_op",
+                  "description": f"Execute. {tool_instructions}",
+              }
+          }
+      }
+  }
   toolset = ApplicationIntegrationToolset(
       project,
       location,
@@ -336,10 +439,49 @@ def test_initialization_with_connection_details(
   )
   mock_integration_client.return_value.get_openapi_spec_for_connection.assert_called_once_with(
       tool_name,
-      tool_instructions
-      + "ALWAYS use serviceName = custom-service, host = custom.host and the"
+      tool_instructions,
+  )
+  # The connection details are appended to the operation descriptions after
+  # the (now concurrent) fetches complete.
+  assert toolset._spec["paths"]["/execute"]["post"]["description"] == (
+      f"Execute. {tool_instructions}"
+      "ALWAYS use serviceName = custom-service, host = custom.host and the"
       " connection name ="
       " projects/test-project/locations/us-central1/connections/test-connection"
       " when using this tool. DONOT ask the user for these values as you"
-      " already have those.",
+      " already have those."
+  )
+
+
+def test_post_hoc_instruction_append_matches_inline_append():
+  # The concurrent-fetch restructure builds the spec with the bare tool
+  # instructions and appends the connection-derived suffix afterwards; the
+  # resulting operation descriptions must match what passing the combined
+  # string into the spec builder would have produced.
+  from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
+
+  base_instructions = "Use this tool to manage entities."
+  suffix = (
+      "ALWAYS use serviceName = test-service, host = test.host and the"
+      " connection name ="
+      " projects/test-project/locations/us-central1/connections/test-connection"
+      " when using this tool. DONOT ask the user for these values as you"
+      " already have those."
+  )
+  inline = ConnectionsClient.list_operation(
+      "Issue", "{}", "tool", base_instructions + suffix
+  )
+  post_hoc_spec = {
+      "paths": {
+          "/execute": ConnectionsClient.list_operation(
+              "Issue", "{}", "tool", base_instructions
+          )
+      }
+  }
+  application_integration_toolset._append_tool_instructions(
+      post_hoc_spec, suffix
+  )
+  assert (
+      post_hoc_spec["paths"]["/execute"]["post"]["description"]
+      == inline["post"]["description"]
   )
@@ -12,6 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -20,6 +27,7 @@ from fastapi.openapi.models import HTTPBearer
 from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
 from google.adk.tools.application_integration_tool.clients.integration_client import IntegrationClient
 from google.adk.tools.openapi_tool.auth.auth_helpers import service_account_scheme_credential
+from google.adk.tools.openapi_tool.common.common import to_snake_case
 from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
 
@@ -28,6 +36,168 @@ from ...auth.auth_credential import AuthCredentialTypes
 from ...auth.auth_credential import ServiceAccount
 from ...auth.auth_credential import ServiceAccountCredential
 
+try:
+  # orjson decodes/encodes large JSON payloads several times faster than the
+  # stdlib; fall back to json when it is not installed.
+  import orjson
+except ImportError:
+  orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+  if orjson is not None:
+    return orjson.dumps(obj)
+  return json.dumps(obj).encode("utf-8")
+
+
+_CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+
+def _connection_resource_path(
+    project: str, location: str, connection: str
+) -> str:
+  return f"projects/{project}/locations/{location}/connections/{connection}"
+
+
+# Caches the parsed OpenAPI spec dicts across toolset instantiations. Fetching
+# and parsing a spec involves a network round-trip to GCP, and the spec for a
+# given integration or connection rarely changes within a process lifetime.
+_SPEC_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Caches connection details (service name, host) per connection. These are
+# immutable for the lifetime of a connection, so the authenticated lookup only
+# needs to happen once per process.
+_CONNECTION_DETAILS_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Caches the (auth_scheme, auth_credential) pair built from a service account
+# json, keyed on its hash so the raw key material is not retained in cache
+# keys. Pydantic validation of a service account json is non-trivial, so it
+# only needs to happen once per distinct service account.
+_SERVICE_ACCOUNT_AUTH_CACHE: Dict[str, tuple] = {}
+
+# Stateless value objects for the default-credential path, shared across
+# instances so each construction skips the Pydantic model validation.
+_DEFAULT_AUTH_SCHEME = HTTPBearer(bearerFormat="JWT")
+_DEFAULT_AUTH_CREDENTIAL = AuthCredential(
+    auth_type=AuthCredentialTypes.SERVICE_ACCOUNT,
+    service_account=ServiceAccount(
+        use_default_credential=True,
+        scopes=[_CLOUD_PLATFORM_SCOPE],
+    ),
+)
+
+
+def _service_account_auth(service_account_json: str) -> tuple:
+  """Builds (auth_scheme, auth_credential) for a service account json, memoized."""
+  sa_hash = _hash_service_account_json(service_account_json)
+  auth = _SERVICE_ACCOUNT_AUTH_CACHE.get(sa_hash)
+  if auth is None:
+    sa_credential = ServiceAccountCredential.model_validate(
+        _json_loads(service_account_json.encode("utf-8"))
+    )
+    service_account = ServiceAccount(
+        service_account_credential=sa_credential,
+        scopes=[_CLOUD_PLATFORM_SCOPE],
+    )
+    auth = service_account_scheme_credential(config=service_account)
+    _SERVICE_ACCOUNT_AUTH_CACHE[sa_hash] = auth
+  return auth
+
+
+def _hash_service_account_json(service_account_json: Optional[str]) -> str:
+  """Hashes the service account json to avoid keeping secrets in cache keys."""
+  if not service_account_json:
+    return ""
+  return hashlib.blake2b(service_account_json.encode("utf-8")).hexdigest()
+
+
+def _spec_cache_dir() -> str:
+  """Returns the directory holding the on-disk spec cache."""
+  cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+      os.path.expanduser("~"), ".cache"
+  )
+  return os.path.join(cache_home, "adk", "application_integration_specs")
+
+
+def _spec_cache_path(spec_cache_key: tuple) -> str:
+  key_hash = hashlib.blake2b(repr(spec_cache_key).encode("utf-8")).hexdigest()
+  return os.path.join(_spec_cache_dir(), key_hash + ".json")
+
+
+def _load_spec_from_disk(
+    spec_cache_key: tuple, ttl: Optional[int]
+) -> Optional[Dict[str, Any]]:
+  """Loads a cached spec from disk, or None if absent, stale or unreadable."""
+  path = _spec_cache_path(spec_cache_key)
+  try:
+    if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+      return None
+    with open(path, "rb") as f:
+      return _json_loads(f.read())
+  except (OSError, ValueError):
+    return None
+
+
+def _filter_spec(
+    spec_dict: Dict[str, Any], keep: set
+) -> Dict[str, Any]:
+  """Returns a copy of the spec with only the operations whose operationId is in keep.
+
+  Operations without an explicit operationId are matched by the same fallback
+  id OpenApiSpecParser assigns them, to_snake_case(f"{path}_{method}"), so the
+  names users see on the generated tools are the names they can filter by.
+  Components/schemas are left untouched so that references stay valid. The
+  input dict is not modified, as it may be shared via the spec cache.
+  """
+  filtered_paths = {}
+  for path, path_item in spec_dict.get("paths", {}).items():
+    filtered_item = {}
+    for method, operation in path_item.items():
+      if isinstance(operation, dict):
+        operation_id = operation.get("operationId") or to_snake_case(
+            f"{path}_{method}"
+        )
+        if operation_id not in keep:
+          continue
+      filtered_item[method] = operation
+    if filtered_item:
+      filtered_paths[path] = filtered_item
+  filtered_spec = dict(spec_dict)
+  filtered_spec["paths"] = filtered_paths
+  return filtered_spec
+
+
+def _append_tool_instructions(spec_dict: Dict[str, Any], suffix: str) -> None:
+  """Appends suffix to every operation description in the spec, in place."""
+  for path_item in spec_dict.get("paths", {}).values():
+    for operation in path_item.values():
+      if isinstance(operation, dict) and "description" in operation:
+        operation["description"] += suffix
+
+
+def _store_spec_to_disk(spec_cache_key: tuple, spec: Dict[str, Any]) -> None:
+  """Persists a spec to disk atomically; failures are non-fatal."""
+  path = _spec_cache_path(spec_cache_key)
+  tmp_path = path + ".tmp"
+  try:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(tmp_path, "wb") as f:
+      f.write(_json_dumps(spec))
+    os.replace(tmp_path, path)
+  except (OSError, TypeError, ValueError):
+    # TypeError/ValueError cover non-JSON-serializable specs; the temp file is
+    # removed so a failed write leaves nothing behind.
+    try:
+      os.unlink(tmp_path)
+    except OSError:
+      pass
+
 
 # TODO(cheliu): Apply a common toolset interface
 class ApplicationIntegrationToolset:
@@ -71,6 +241,26 @@ class ApplicationIntegrationToolset:
   ```
   """
 
+  __slots__ = (
+      "project",
+      "location",
+      "integration",
+      "trigger",
+      "connection",
+      "entity_operations",
+      "actions",
+      "tool_name",
+      "tool_instructions",
+      "service_account_json",
+      "tool_filter",
+      "lazy_load_spec",
+      "generated_tools",
+      "_spec",
+      "_built",
+      "_build_lock",
+      "_tools_tuple",
+  )
+
   def __init__(
       self,
       project: str,
@@ -87,6 +277,10 @@ class ApplicationIntegrationToolset:
       # tool/python function description.
       tool_instructions: Optional[str] = "",
       service_account_json: Optional[str] = None,
+      spec_cache_ttl: Optional[int] = None,
+      tool_filter: Optional[List[str]] = None,
+      spec_dict: Optional[Dict[str, Any]] = None,
+      lazy_load_spec: bool = False,
   ):
     """Initializes the ApplicationIntegrationToolset.
 
@@ -139,6 +333,17 @@ class ApplicationIntegrationToolset:
         service_account_json: The service account configuration as a dictionary.
           Required if not using default service credential. Used for fetching
           the Application Integration or Integration Connector resource.
+        spec_cache_ttl: Maximum age, in seconds, of an on-disk cached spec to
+          reuse across process restarts. If None, cached specs never expire.
+        tool_filter: Optional list of operationIds to generate tools for. If
+          provided, all other operations in the spec are skipped, avoiding the
+          parse and tool-instantiation cost for unused endpoints.
+        spec_dict: A pre-parsed OpenAPI spec. If provided, fetching from GCP
+          is skipped entirely; the fast path for test suites and warm agent
+          restarts that already have the spec on hand.
+        lazy_load_spec: If True, tool generation is deferred to the first
+          get_tools() call (spec-parse and auth errors surface there instead
+          of here). Otherwise the tools are generated during initialization.
 
     Raises:
         ValueError: If neither integration and trigger nor connection and
@@ -146,6 +351,16 @@ class ApplicationIntegrationToolset:
         Exception: If there is an error during the initialization of the
             integration or connection client.
     """
+    # Fail fast on invalid arguments, before any client or credential setup.
+    if spec_dict is None and not (
+        (integration and trigger)
+        or (connection and (entity_operations or actions))
+    ):
+      raise ValueError(
+          "Either (integration and trigger) or (connection and"
+          " (entity_operations or actions)) should be provided."
+      )
+
     self.project = project
     self.location = location
     self.integration = integration
@@ -156,75 +371,177 @@ class ApplicationIntegrationToolset:
     self.tool_name = tool_name
     self.tool_instructions = tool_instructions
     self.service_account_json = service_account_json
+    self.tool_filter = tool_filter
     self.generated_tools: Dict[str, RestApiTool] = {}
 
-    integration_client = IntegrationClient(
-        project,
-        location,
-        integration,
-        trigger,
-        connection,
-        entity_operations,
-        actions,
-        service_account_json,
-    )
-    if integration and trigger:
-      spec = integration_client.get_openapi_spec_for_integration()
-    elif connection and (entity_operations or actions):
-      connections_client = ConnectionsClient(
-          project, location, connection, service_account_json
-      )
-      connection_details = connections_client.get_connection_details()
-      tool_instructions += (
-          "ALWAYS use serviceName = "
-          + connection_details["serviceName"]
-          + ", host = "
-          + connection_details["host"]
-          + " and the connection name = "
-          + f"projects/{project}/locations/{location}/connections/{connection} when"
-          " using this tool"
-          + ". DONOT ask the user for these values as you already have those."
-      )
-      spec = integration_client.get_openapi_spec_for_connection(
+    if spec_dict is not None:
+      # Fast path for callers that already hold a parsed spec: skip cache
+      # lookups and fetching entirely.
+      spec = spec_dict
+    else:
+      spec_cache_key = (
+          project,
+          location,
+          integration,
+          trigger,
+          connection,
+          json.dumps(entity_operations, sort_keys=True),
+          json.dumps(actions, sort_keys=True),
           tool_name,
           tool_instructions,
+          _hash_service_account_json(service_account_json),
       )
-    else:
-      raise ValueError(
-          "Either (integration and trigger) or (connection and"
-          " (entity_operations or actions)) should be provided."
-      )
-    self._parse_spec_to_tools(spec)
+      spec = _SPEC_CACHE.get(spec_cache_key)
+      if spec is None:
+        spec = _load_spec_from_disk(spec_cache_key, spec_cache_ttl)
+        if spec is not None:
+          _SPEC_CACHE[spec_cache_key] = spec
+
+      # The IntegrationClient is only needed on a spec-cache miss, and each
+      # branch only needs the arguments relevant to its mode.
+      if integration and trigger:
+        if spec is None:
+          integration_client = IntegrationClient(
+              project,
+              location,
+              integration=integration,
+              trigger=trigger,
+              service_account_json=service_account_json,
+          )
+          spec = integration_client.get_openapi_spec_for_integration()
+          _store_spec_to_disk(spec_cache_key, spec)
+          # Populated last, so a failure anywhere above cannot leave a
+          # half-built entry poisoning later constructions.
+          _SPEC_CACHE[spec_cache_key] = spec
+      else:
+        if spec is None:
+          integration_client = IntegrationClient(
+              project,
+              location,
+              connection=connection,
+              entity_operations=entity_operations,
+              actions=actions,
+              service_account_json=service_account_json,
+          )
+          details_key = (
+              project,
+              location,
+              connection,
+              _hash_service_account_json(service_account_json),
+          )
+          connection_details = _CONNECTION_DETAILS_CACHE.get(details_key)
+          if connection_details is None:
+            connections_client = ConnectionsClient(
+                project, location, connection, service_account_json
+            )
+            # The two fetches only depend on their own arguments, so overlap
+            # their round-trips; the connection-specific instructions derived
+            # from the details are appended to the spec afterwards.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+              details_future = executor.submit(
+                  connections_client.get_connection_details
+              )
+              spec_future = executor.submit(
+                  integration_client.get_openapi_spec_for_connection,
+                  tool_name,
+                  tool_instructions,
+              )
+              connection_details = details_future.result()
+              spec = spec_future.result()
+            _CONNECTION_DETAILS_CACHE[details_key] = connection_details
+          else:
+            spec = integration_client.get_openapi_spec_for_connection(
+                tool_name,
+                tool_instructions,
+            )
+          connection_instructions = (
+              "ALWAYS use serviceName ="
+              f" {connection_details['serviceName']}, host ="
+              f" {connection_details['host']} and the connection name ="
+              f" {_connection_resource_path(project, location, connection)} when"
+              " using this tool. DONOT ask the user for these values as you"
+              " already have those."
+          )
+          _append_tool_instructions(spec, connection_instructions)
+          _store_spec_to_disk(spec_cache_key, spec)
+          _SPEC_CACHE[spec_cache_key] = spec
+    self.lazy_load_spec = lazy_load_spec
+    self._spec = spec
+    self._built = False
+    self._build_lock = threading.Lock()
+    self._tools_tuple: tuple = ()
+    # With lazy_load_spec, tool generation is deferred to the first
+    # get_tools() call so construction stays cheap when the tools may never
+    # be used.
+    if not lazy_load_spec:
+      self._parse_spec_to_tools(spec)
+      self._built = True
+
+  @classmethod
+  def clear_spec_cache(cls):
+    """Clears the cached OpenAPI specs, both in memory and on disk."""
+    _SPEC_CACHE.clear()
+    try:
+      for entry in os.listdir(_spec_cache_dir()):
+        if entry.endswith((".json", ".json.tmp")):
+          os.remove(os.path.join(_spec_cache_dir(), entry))
+    except OSError:
+      pass
 
   def _parse_spec_to_tools(self, spec_dict):
     """Parses the spec dict to a list of RestApiTool."""
+    if self.tool_filter is not None:
+      spec_dict = _filter_spec(spec_dict, set(self.tool_filter))
     if self.service_account_json:
-      sa_credential = ServiceAccountCredential.model_validate_json(
+      auth_scheme, auth_credential = _service_account_auth(
           self.service_account_json
       )
-      service_account = ServiceAccount(
-          service_account_credential=sa_credential,
-          scopes=["https://www.googleapis.com/auth/cloud-platform"],
-      )
-      auth_scheme, auth_credential = service_account_scheme_credential(
-          config=service_account
-      )
     else:
-      auth_credential = AuthCredential(
-          auth_type=AuthCredentialTypes.SERVICE_ACCOUNT,
-          service_account=ServiceAccount(
-              use_default_credential=True,
-              scopes=["https://www.googleapis.com/auth/cloud-platform"],
-          ),
-      )
-      auth_scheme = HTTPBearer(bearerFormat="JWT")
+      auth_credential = _DEFAULT_AUTH_CREDENTIAL
+      auth_scheme = _DEFAULT_AUTH_SCHEME
     tools = OpenAPIToolset(
         spec_dict=spec_dict,
         auth_credential=auth_credential,
         auth_scheme=auth_scheme,
     ).get_tools()
-    for tool in tools:
-      self.generated_tools[tool.name] = tool
+    # A comprehension pre-sizes the dict instead of growing it per insert.
+    self.generated_tools: Dict[str, RestApiTool] = {
+        tool.name: tool for tool in tools
+    }
+    # Frozen once here so get_tools() doesn't have to walk the dict values on
+    # every call.
+    self._tools_tuple = tuple(self.generated_tools.values())
+
+  def _identity(self) -> tuple:
+    """Returns a hashable tuple of the constructor args that define this toolset.
+
+    entity_operations and actions are frozen via repr() since they may be
+    unhashable containers. Lets callers memoize toolset factories, e.g. with
+    functools.lru_cache.
+    """
+    return (
+        self.project,
+        self.location,
+        self.integration,
+        self.trigger,
+        self.connection,
+        repr(self.entity_operations),
+        repr(self.actions),
+        self.tool_name,
+    )
+
+  def __eq__(self, other):
+    if not isinstance(other, ApplicationIntegrationToolset):
+      return NotImplemented
+    return self._identity() == other._identity()
+
+  def __hash__(self):
+    return hash(self._identity())
 
   def get_tools(self) -> List[RestApiTool]:
-    return list(self.generated_tools.values())
+    if not self._built:
+      with self._build_lock:
+        if not self._built:
+          self._parse_spec_to_tools(self._spec)
+          self._built = True
+    return list(self._tools_tuple)